@@ -1,21 +1,40 @@
-from typing import List, Dict, Generator
+from typing import List, Dict, Generator, Set, Tuple
 import csv
 import re
 import os
+import threading
 from urllib.parse import urlparse
-from .api import call_openrouter, call_openrouter_stream
+from .api import call_openrouter, call_openrouter_stream, reset_session
 from .prompts import general_prompt
 from .config import Config
 from .hfd import upload_to_hf
+from .index import PaperIndex, extract_arxiv_id
 
 ROW_TYPE = ["title", "keywords", "url", "type"]
 
-def split_into_types(main_folder: str, types: List[str]):
+def normalize_paper(paper: Dict) -> Dict[str, str]:
+    """Return a paper with exactly the ROW_TYPE fields, all strings.
+    
+    Missing fields and None become ""; any other non-string value raises
+    ValueError so it never reaches the index or the CSV file.
+    """
+    normalized = {}
+    for field in ROW_TYPE:
+        value = paper.get(field)
+        if value is None:
+            value = ''
+        if not isinstance(value, str):
+            raise ValueError(f"Field '{field}' must be a string, got {type(value).__name__}")
+        normalized[field] = value
+    return normalized
+
+def split_into_types(main_folder: str, types: List[str], papers_by_type: Dict[str, List[Dict]] = None):
     """Split papers from main folder into type-specific folders.
     
     Args:
         main_folder (str): Path to the main folder containing all papers (e.g., data/all)
         types (List[str]): List of paper types to split into (e.g., ["efficiency", "interpretability"])
+        papers_by_type (Dict[str, List[Dict]]): Papers already grouped by lowercase type; skips re-reading the CSV
     """
     try:
         main_folder = os.path.join(main_folder, "all")
@@ -24,19 +43,20 @@ def split_into_types(main_folder: str, types: List[str]):
             print(f"Main folder {main_folder} does not exist.")
             return False
             
-        # Read the CSV file from main folder
-        main_csv = os.path.join(main_folder, "papers.csv")
-        print(f"Reading CSV file from {main_csv}")
-            
-        # Read all papers
-        papers_by_type = {}
-        with open(main_csv, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for paper in reader:
-                paper_type = paper['type'].lower()
-                if paper_type not in papers_by_type:
-                    papers_by_type[paper_type] = []
-                papers_by_type[paper_type].append(paper)
+        if papers_by_type is None:
+            # Read the CSV file from main folder
+            main_csv = os.path.join(main_folder, "papers.csv")
+            print(f"Reading CSV file from {main_csv}")
+                
+            # Read all papers
+            papers_by_type = {}
+            with open(main_csv, 'r', encoding='utf-8') as f:
+                reader = csv.DictReader(f, restval='')
+                for paper in reader:
+                    paper_type = paper['type'].lower()
+                    if paper_type not in papers_by_type:
+                        papers_by_type[paper_type] = []
+                    papers_by_type[paper_type].append(paper)
         
         # Create type folders and save papers
         base_dir = os.path.dirname(main_folder)
@@ -63,7 +83,8 @@ class PaperManager:
         self, 
         config: Config = None,
         csv_file: str = None,
-        api_key: str = None
+        api_key: str = None,
+        background_load: bool = False
     ):
         # Use provided config or create default one
         self.config = config or Config()
@@ -81,21 +102,106 @@ class PaperManager:
         self.folder = self.config.hf_folder
         self.repo_id = self.config.hf_repo_id
         
-        self.papers = []
         self.conversation = []
         
-        # initialize papers and csv file
+        # Serializes writes to the store with config reloads (UI event handlers, the
+        # HTTP server and the config watcher run on different threads); reentrant
+        # so PaperService can hold it across a whole batch
+        self.lock = threading.RLock()
+        
+        # initialize papers and csv file, optionally while the caller keeps starting up
+        self._start_load(background_load)
+        if not background_load and self._load_error is not None:
+            raise self._load_error
+    
+    def _start_load(self, background: bool):
+        """Load the store from self.csv_file, optionally in a background thread"""
+        self._loaded = threading.Event()
+        self._load_error = None
+        if background:
+            threading.Thread(target=self._load_store, daemon=True).start()
+        else:
+            self._load_store()
+    
+    def _load_store(self):
+        try:
+            self._index = self._read_store(self.csv_file)
+        except Exception as e:
+            self._load_error = e
+        finally:
+            self._loaded.set()
+    
+    @staticmethod
+    def _read_store(csv_file: str) -> PaperIndex:
+        """Read the CSV file into memory (creating it if missing) and build the index"""
         try:
-            with open(self.csv_file, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                self.papers = list(reader)
+            with open(csv_file, 'r', encoding='utf-8') as file:
+                # Hand-edited rows may be short; missing columns read as "" rather than None
+                reader = csv.DictReader(file, restval='')
+                papers = list(reader)
         except FileNotFoundError:
-            self.papers = []
+            papers = []
+        index = PaperIndex(papers)
     
-        if not os.path.exists(self.csv_file):
-            with open(self.csv_file, 'w', encoding='utf-8', newline='') as file:
+        if not os.path.exists(csv_file):
+            with open(csv_file, 'w', encoding='utf-8', newline='') as file:
                 writer = csv.writer(file)
                 writer.writerow(ROW_TYPE)
+        return index
+    
+    def apply_config(self, config: Config, changed: Set[str] = None):
+        """Hot-apply a new config, rebuilding only the components it affects.
+        
+        A new csv_file is loaded before it replaces the current store; if it
+        cannot be loaded, the current store and path stay in use.
+        
+        Args:
+            config (Config): The new configuration; it replaces self.config rather than being copied into it
+            changed (Set[str]): Names of the fields that changed (computed if not given)
+        """
+        if changed is None:
+            changed = config.diff(self.config)
+        
+        index = None
+        if "csv_file" in changed and config.csv_file != self.csv_file:
+            # Let a background startup load finish so it cannot overwrite the new store
+            self._loaded.wait()
+            # Read outside the lock so edits are not blocked while a large file loads
+            try:
+                index = self._read_store(config.csv_file)
+            except Exception as e:
+                print(f"⚠️  Keeping {self.csv_file}, could not load {config.csv_file}: {e}")
+                config.csv_file = self.csv_file
+        
+        with self.lock:
+            if index is not None:
+                # The index and its file are swapped together, between two writes
+                self._index = index
+                self._load_error = None
+                self.csv_file = config.csv_file
+            
+            self.config = config
+            self.api_key = config.api_key
+            self.model = config.api_model
+            self.paper_types = config.paper_types
+            self.folder = config.hf_folder
+            self.repo_id = config.hf_repo_id
+        
+        if "api_key" in changed:
+            # Drop connections pooled under the old credentials
+            reset_session()
+    
+    @property
+    def index(self) -> PaperIndex:
+        """The paper index, waiting for a background load to finish if needed"""
+        self._loaded.wait()
+        if self._load_error is not None:
+            raise self._load_error
+        return self._index
+    
+    @property
+    def papers(self) -> List[Dict]:
+        return self.index.papers
     
     def parse_paper(self, input_text: str) -> List[Dict]:
         """Parse input text into paper details using regex"""
@@ -138,73 +244,136 @@ class PaperManager:
     
     def extract_arxiv_id(self, title: str) -> str:
         """Extract arXiv ID from title format [arXiv_ID] Title"""
-        match = re.search(r'\[(\d{4}\.\d{4,5})\]', title)
-        return match.group(1) if match else ""
+        return extract_arxiv_id(title)
     
     def add_paper(self, title: str, url: str, keywords: str = "", paper_type: str = ""):
         """Add a single paper to the CSV file"""
-        paper = {
+        return self.add_papers([{
             'title': title,
             'keywords': keywords,
             'url': url,
             'type': paper_type
-        }
-        
-        # Extract arXiv ID from the new paper
-        new_arxiv_id = self.extract_arxiv_id(title)
+        }])[0]
+    
+    def add_papers(self, papers: List[Dict]) -> List[bool]:
+        """Add several papers with a single append to the CSV file.
         
-        # Check if paper already exists (by title or arXiv ID)
-        for existing_paper in self.papers:
-            # Check by exact title match
-            if existing_paper['title'].lower() == title.lower():
-                print(f"Paper '{title}' already exists!")
-                return False
+        Returns one flag per input paper, False for duplicates (including
+        duplicates within the batch itself). The batch is all-or-nothing: an
+        invalid field (see normalize_paper) or a failed write raises before
+        anything is added to memory.
+        """
+        with self.lock:
+            papers = [normalize_paper(paper) for paper in papers]
             
-            # Check by arXiv ID if both papers have arXiv IDs
-            if new_arxiv_id:
-                existing_arxiv_id = self.extract_arxiv_id(existing_paper['title'])
-                if existing_arxiv_id and existing_arxiv_id == new_arxiv_id:
-                    print(f"Paper with arXiv ID '{new_arxiv_id}' already exists: {existing_paper['title']}")
-                    return False
-        
-        # Add to memory
-        self.papers.append(paper)
-        
-        # Add to CSV file - correct order: title, keywords, url, type
-        with open(self.csv_file, 'a', encoding='utf-8', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([title, keywords, url, paper_type])
-        
-        return True
+            # Check if papers already exist (by title or arXiv ID), in the store or earlier in the batch
+            batch = PaperIndex([])
+            added = []
+            for paper in papers:
+                duplicate = batch.find_duplicate(paper['title'])
+                if duplicate is not None:
+                    print(f"Paper '{paper['title']}' duplicates '{duplicate['title']}' in the same batch!")
+                ok = duplicate is None and self._check_unique(paper['title'])
+                if ok:
+                    batch.add(paper)
+                added.append(ok)
+            
+            if batch.papers:
+                # Add to CSV file - correct order: title, keywords, url, type
+                with open(self.csv_file, 'a', encoding='utf-8', newline='') as file:
+                    writer = csv.writer(file)
+                    writer.writerows([paper[field] for field in ROW_TYPE] for paper in batch.papers)
+            
+                # Add to memory only once the rows are on disk
+                for paper in batch.papers:
+                    self.index.add(paper)
+            
+            return added
+    
+    def _check_unique(self, title: str, ignore: Dict = None) -> bool:
+        """Return False (and report why) if a paper with this title or arXiv ID exists"""
+        existing_paper = self.index.find_duplicate(title, ignore)
+        if existing_paper is None:
+            return True
+        if existing_paper['title'].lower() == title.lower():
+            print(f"Paper '{title}' already exists!")
+        else:
+            print(f"Paper with arXiv ID '{self.extract_arxiv_id(title)}' already exists: {existing_paper['title']}")
+        return False
+    
+    def _rewrite_csv(self):
+        """Rewrite the entire CSV file from memory"""
+        with open(self.csv_file, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(file, fieldnames=ROW_TYPE)
+            writer.writeheader()
+            writer.writerows(self.papers)
     
     def delete_paper(self, title: str):
         """Delete a paper by title"""
-        original_count = len(self.papers)
-        self.papers = [p for p in self.papers if p['title'].lower() != title.lower()]
+        with self.lock:
+            if self.index.remove_title(title):
+                self._rewrite_csv()
+                return True
+            return False
+    
+    def update_paper(self, title: str, changes: Dict[str, str]) -> bool:
+        """Update fields of the paper with this title and persist the change"""
+        return self.update_papers([(title, changes)])[0]
+    
+    def update_papers(self, updates: List[Tuple[str, Dict[str, str]]]) -> List[bool]:
+        """Apply several (title, changes) updates, rewriting the CSV file once.
         
-        if len(self.papers) < original_count:
-            # Rewrite the entire CSV file
-            with open(self.csv_file, 'w', encoding='utf-8', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=ROW_TYPE)
-                writer.writeheader()
-                writer.writerows(self.papers)
-            return True
-        return False
+        Returns one flag per update, False for unknown titles, no-op changes and
+        renames that would create a duplicate.
+        """
+        with self.lock:
+            applied = []
+            for title, changes in updates:
+                paper = self.index.titles.get(title.lower())
+                if paper is None:
+                    print(f"Paper '{title}' does not exist!")
+                    applied.append(False)
+                    continue
+            
+                changes = {k: v for k, v in changes.items() if k in ROW_TYPE and paper[k] != v}
+                if not changes or ('title' in changes and not self._check_unique(changes['title'], ignore=paper)):
+                    applied.append(False)
+                    continue
+            
+                self.index.update(paper, changes)
+                applied.append(True)
+            
+            if any(applied):
+                self._rewrite_csv()
+            return applied
     
     def search_paper(self, query: str) -> List[Dict]:
         """Search for papers by title or keywords"""
-        results = []
-        query_lower = query.lower()
-        
-        for paper in self.papers:
-            if (query_lower in paper['title'].lower() or 
-                query_lower in paper['keywords'].lower()):
-                results.append(paper)
-        
-        return results
+        return self.index.search(query)
+    
+    def list_papers(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        paper_type: str = "",
+        keyword: str = "",
+        sort_by: str = "",
+        descending: bool = False
+    ):
+        """Return one page of papers, the total match count and the clamped page (see PaperIndex.page)"""
+        return self.index.page(page, page_size, paper_type, keyword, sort_by, descending)
+    
+    def split_into_types(self) -> bool:
+        """Split papers into type folders, reusing the in-memory index when it backs the main CSV"""
+        with self.lock:
+            main_csv = os.path.join(self.folder, "all", "papers.csv")
+            papers_by_type = None
+            if os.path.abspath(main_csv) == os.path.abspath(self.csv_file):
+                papers_by_type = self.index.by_type
+            return split_into_types(self.folder, self.paper_types, papers_by_type)
     
     def upload_to_hf(self):
-        upload_to_hf(self.folder, self.repo_id, "dataset", self.config.api_key)
+        upload_to_hf(self.folder, self.repo_id, "dataset", self.config.hf_token)
         
     def chat_stream(self, prompt: str) -> Generator[str, None, None]:
         """Main chat interface with streaming response"""
@@ -234,18 +403,10 @@ class PaperManager:
             papers_to_add = self.parse_paper(full_response)
             
             if papers_to_add:
-                added_count = 0
-                for paper in papers_to_add:
-                    if self.add_paper(
-                        paper.get('title', ''),
-                        paper.get('url', ''),
-                        paper.get('keywords', ''),
-                        paper.get('type', '')
-                    ):
-                        added_count += 1
+                added_count = sum(self.add_papers(papers_to_add))
                 
                 if added_count > 0:
-                    if split_into_types(self.folder, self.paper_types):
+                    if self.split_into_types():
                         success_msg = f"\n\n✅ Successfully split papers by type."
                         yield success_msg
                     else:
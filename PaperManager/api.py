@@ -1,14 +1,41 @@
-import requests
 import json
+import threading
 from typing import List, Dict, Optional, Generator
 
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+_session = None
+_session_lock = threading.Lock()
+
+def get_session():
+    """Return the shared HTTP session, creating it on first use.
+    
+    Reusing one session keeps connections to the API pooled between calls.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            # Imported lazily so headless commands that never call the API start fast
+            import requests
+            _session = requests.Session()
+        return _session
+
+def reset_session():
+    """Close the pooled connections; the next call opens a fresh session"""
+    global _session
+    with _session_lock:
+        if _session is not None:
+            _session.close()
+            _session = None
+
 def call_openrouter_stream(
     prompt: str, 
     api_key: str, 
     model: str,
     temperature: float = 0.3,
     max_tokens: int = 500000,
-    conversation: List[Dict[str, str]] = None
+    conversation: List[Dict[str, str]] = None,
+    url: str = OPENROUTER_URL
 ) -> Generator[str, None, None]:
     """Call LLM API to get streaming response"""
     if not conversation:
@@ -21,8 +48,8 @@ def call_openrouter_stream(
         return
         
     try:
-        response = requests.post(
-            url="https://openrouter.ai/api/v1/chat/completions",
+        response = get_session().post(
+            url=url,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
@@ -58,6 +85,8 @@ def call_openrouter_stream(
                             if data == '[DONE]':
                                 # Add the complete response to conversation
                                 conversation.append({"role": "assistant", "content": full_content})
+                                # Hand the connection back to the pool
+                                response.close()
                                 return
 
                             try:
@@ -81,7 +110,8 @@ def call_openrouter(
     model: str,
     temperature: float = 0.3,
     max_tokens: int = 500000,
-    conversation: List[Dict[str, str]] = None
+    conversation: List[Dict[str, str]] = None,
+    url: str = OPENROUTER_URL
 ) -> Optional[str]:
     """Call LLM API to get response (non-streaming version)"""
     if not conversation:
@@ -94,8 +124,8 @@ def call_openrouter(
         return None, None
         
     try:
-        response = requests.post(
-            url="https://openrouter.ai/api/v1/chat/completions",
+        response = get_session().post(
+            url=url,
             headers={
                 "Authorization": f"Bearer {api_key}",
                 "Content-Type": "application/json",
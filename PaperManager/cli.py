@@ -0,0 +1,104 @@
+import argparse
+import contextlib
+import json
+import sys
+from .agent import PaperManager, split_into_types
+from .config import Config, ConfigWatcher
+from .hfd import upload_to_hf
+
+def add_subcommands(parser: argparse.ArgumentParser):
+    """Register the headless commands; without one, main.py launches the UI"""
+    subparsers = parser.add_subparsers(dest="command", title="headless commands")
+
+    add_parser = subparsers.add_parser("add", help="Add a paper to the CSV file")
+    add_parser.add_argument("--title", required=True, help="Paper title, e.g. '[2210.01117] Omnigrok: ...'")
+    add_parser.add_argument("--url", required=True, help="Paper URL")
+    add_parser.add_argument("--keywords", default="", help="Comma-separated keywords")
+    add_parser.add_argument("--type", default="", dest="paper_type", help="Paper type")
+
+    search_parser = subparsers.add_parser("search", help="Search papers by title or keywords")
+    search_parser.add_argument("query", help="Text to look for")
+
+    subparsers.add_parser("split", help="Split papers into type-specific folders")
+    subparsers.add_parser("upload", help="Upload the data folder to Hugging Face")
+
+    batch_parser = subparsers.add_parser("batch", help="Run JSON-lines requests (one {\"op\": ...} per line)")
+    batch_parser.add_argument("file", nargs="?", default="-", help="Requests file, '-' for stdin")
+
+    serve_parser = subparsers.add_parser("serve", help="Serve a JSON HTTP API with the store kept in memory")
+    serve_parser.add_argument("--host", default="127.0.0.1", help="Interface to bind")
+    serve_parser.add_argument("--port", type=int, default=8765, help="Port to listen on")
+
+def run_command(args: argparse.Namespace, config: Config, watcher: ConfigWatcher = None) -> int:
+    """Run a headless command and return the process exit code.
+    
+    Only the long-lived `serve` command subscribes to `watcher`.
+    """
+    if args.command == "add":
+        manager = PaperManager(config=config)
+        if manager.add_paper(args.title, args.url, args.keywords, args.paper_type):
+            print(f"✅ Added '{args.title}'")
+            return 0
+        return 1
+
+    if args.command == "search":
+        manager = PaperManager(config=config)
+        for paper in manager.search_paper(args.query):
+            print(json.dumps(paper, ensure_ascii=False))
+        return 0
+
+    if args.command == "split":
+        if split_into_types(config.hf_folder, config.paper_types):
+            print("✅ Successfully split papers by type.")
+            return 0
+        print("❌ Failed to split papers by type.")
+        return 1
+
+    if args.command == "upload":
+        try:
+            upload_to_hf(config.hf_folder, config.hf_repo_id, "dataset", config.hf_token)
+        except Exception as e:
+            print(f"❌ Upload failed: {str(e)}")
+            return 1
+        print("✅ Successfully uploaded to Hugging Face!")
+        return 0
+
+    if args.command == "batch":
+        # http.server is slow to import, so the server module is only loaded by batch and serve
+        from .server import PaperService
+        try:
+            stream = sys.stdin if args.file == "-" else open(args.file, 'r', encoding='utf-8')
+        except OSError as e:
+            print(f"❌ Cannot read requests: {str(e)}")
+            return 1
+        with stream:
+            lines = [(number, line) for number, line in enumerate(stream, 1) if line.strip()]
+        
+        # Malformed lines get their own error result instead of aborting the run
+        requests, results = [], [None] * len(lines)
+        for i, (number, line) in enumerate(lines):
+            try:
+                requests.append((i, json.loads(line)))
+            except ValueError as e:
+                results[i] = {"ok": False, "error": f"Invalid JSON on line {number}: {e}"}
+        
+        # Keep stdout for the JSON results; progress messages go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            service = PaperService(PaperManager(config=config))
+            for (i, _), result in zip(requests, service.batch([request for _, request in requests])):
+                results[i] = result
+        for result in results:
+            print(json.dumps(result, ensure_ascii=False))
+        return 0 if all(result["ok"] for result in results) else 1
+
+    if args.command == "serve":
+        from .server import PaperService, serve
+        manager = PaperManager(config=config)
+        if watcher:
+            # apply_config takes the manager's lock, so reloads never land mid-batch
+            watcher.subscribe(manager.apply_config)
+            watcher.start()
+        serve(PaperService(manager), args.host, args.port)
+        return 0
+
+    raise ValueError(f"Unknown command: {args.command}")
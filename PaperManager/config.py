@@ -1,7 +1,48 @@
 import toml
 import os
-from dataclasses import dataclass
-from typing import List
+import threading
+from dataclasses import dataclass, field, fields, replace
+from typing import Callable, Dict, List, Set, Tuple
+
+# (section, key) in the TOML file -> Config field, mirroring save_to_file
+FILE_FIELDS = {
+    ("api", "model"): "api_model",
+    ("api", "temperature"): "api_temperature",
+    ("api", "max_tokens"): "api_max_tokens",
+    ("api", "api_key"): "api_key",
+    ("api", "key"): "api_key",
+    ("paper", "types"): "paper_types",
+    ("paper", "csv_file"): "csv_file",
+    ("hf", "folder"): "hf_folder",
+    ("hf", "repo_id"): "hf_repo_id",
+    ("hf", "token"): "hf_token",
+    ("ui", "theme"): "ui_theme",
+    ("ui", "chatbot_height"): "chatbot_height",
+    ("ui", "debug"): "debug",
+}
+
+# Field -> (accepted types, extra check, description of the check)
+CONFIG_SCHEMA = {
+    "api_model": ((str,), lambda v: bool(v.strip()), "a non-empty string"),
+    "api_temperature": ((int, float), lambda v: 0 <= v <= 2, "a number between 0 and 2"),
+    "api_max_tokens": ((int,), lambda v: v > 0, "a positive integer"),
+    "api_key": ((str,), None, "a string"),
+    "paper_types": ((list,), lambda v: bool(v) and all(isinstance(t, str) and t.strip() for t in v), "a non-empty list of names"),
+    "csv_file": ((str,), lambda v: bool(v.strip()), "a non-empty path"),
+    "hf_folder": ((str,), lambda v: bool(v.strip()), "a non-empty path"),
+    "hf_repo_id": ((str,), None, "a string"),
+    "hf_token": ((str,), None, "a string"),
+    "ui_theme": ((str,), None, "a string"),
+    "chatbot_height": ((int,), lambda v: v > 0, "a positive integer"),
+    "debug": ((bool,), None, "true or false"),
+}
+
+# Parsed configs keyed by absolute path, reused while the file's mtime and size are unchanged
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], 'Config']] = {}
+
+def _file_stamp(config_file: str) -> Tuple[int, int]:
+    stat = os.stat(config_file)
+    return stat.st_mtime_ns, stat.st_size
 
 @dataclass
 class Config:
@@ -9,7 +50,7 @@ class Config:
     api_model: str = "google/gemini-2.0-flash-001"
     api_temperature: float = 0.3
     api_max_tokens: int = 1000000
-    api_key: str = ""
+    api_key: str = field(default="", repr=False)
     
     # Paper settings
     paper_types: List[str] = None
@@ -18,7 +59,7 @@ class Config:
     # HF settings
     hf_folder: str = "data"
     hf_repo_id: str = "MikaStars39/MikaDailyPaper"
-    hf_token: str = ""
+    hf_token: str = field(default="", repr=False)
     
     # UI settings
     ui_theme: str = "soft"
@@ -29,32 +70,72 @@ class Config:
         if self.paper_types is None:
             self.paper_types = ["agent_rl", "interpretability", "efficiency"]
     
+    def copy(self) -> 'Config':
+        """Return an independent copy (paper_types is not shared)"""
+        return replace(self, paper_types=list(self.paper_types))
+    
+    def validate(self) -> List[str]:
+        """Check every field against CONFIG_SCHEMA and return the problems found"""
+        errors = []
+        for name, (types, check, expected) in CONFIG_SCHEMA.items():
+            value = getattr(self, name)
+            # bool is an int subclass, but `debug = 1` or `max_tokens = true` are mistakes
+            valid_type = isinstance(value, types) and (isinstance(value, bool) == (bool in types))
+            if not valid_type or (check and not check(value)):
+                # Never echo secrets (the repr=False fields) into logs
+                got = type(value).__name__ if not self.__dataclass_fields__[name].repr else repr(value)
+                errors.append(f"{name} must be {expected}, got {got}")
+        return errors
+    
+    def diff(self, other: 'Config') -> Set[str]:
+        """Return the names of fields whose values differ from `other`"""
+        return {f.name for f in fields(self) if getattr(self, f.name) != getattr(other, f.name)}
+    
+    @classmethod
+    def parse_file(cls, config_file: str) -> 'Config':
+        """Parse and validate a TOML file, raising on any error.
+        
+        The parsed Config is cached until the file changes; callers get a copy
+        they are free to modify.
+        """
+        path = os.path.abspath(config_file)
+        stamp = _file_stamp(path)
+        cached = _CONFIG_CACHE.get(path)
+        if cached and cached[0] == stamp:
+            return cached[1].copy()
+        
+        with open(path, 'r', encoding='utf-8') as f:
+            data = toml.load(f)
+        
+        # Flatten nested structure
+        config_data = {}
+        valid_fields = {f.name for f in fields(cls)}
+        for section, values in data.items():
+            if not isinstance(values, dict):
+                print(f"Ignoring unknown config key '{section}'")
+                continue
+            for key, value in values.items():
+                # Fall back to the <section>_<key> naming used before FILE_FIELDS existed
+                name = FILE_FIELDS.get((section, key), f"{section}_{key}")
+                if name in valid_fields:
+                    config_data[name] = value
+                else:
+                    print(f"Ignoring unknown config key '{section}.{key}'")
+        
+        config = cls(**config_data)
+        errors = config.validate()
+        if errors:
+            raise ValueError(f"Invalid config {config_file}: " + "; ".join(errors))
+        
+        _CONFIG_CACHE[path] = (stamp, config)
+        return config.copy()
+    
     @classmethod
     def load_from_file(cls, config_file: str = "config/base.toml") -> 'Config':
         """Load configuration from TOML file"""
         try:
             if os.path.exists(config_file):
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    data = toml.load(f)
-                
-                # Flatten nested structure
-                config_data = {}
-                if 'api' in data:
-                    config_data.update({f'api_{k}': v for k, v in data['api'].items()})
-                if 'paper' in data:
-                    config_data.update({f'paper_{k}' if k != 'types' else 'paper_types': v for k, v in data['paper'].items()})
-                if 'hf' in data:
-                    config_data.update({f'hf_{k}': v for k, v in data['hf'].items()})
-                if 'ui' in data:
-                    config_data.update({f'ui_{k}': v for k, v in data['ui'].items()})
-                
-                # Only include fields that exist in the dataclass
-                valid_fields = {field.name for field in cls.__dataclass_fields__.values()}
-                filtered_data = {k: v for k, v in config_data.items() if k in valid_fields}
-
-                print(filtered_data)
-                
-                return cls(**filtered_data)
+                return cls.parse_file(config_file)
             else:
                 return cls()
         except Exception as e:
@@ -100,7 +181,7 @@ class Config:
     
     def update_config(self, section: str, key: str, value):
         """Update a configuration value"""
-        field_name = f"{section}_{key}" if section != "paper" or key != "types" else "paper_types"
+        field_name = FILE_FIELDS.get((section, key), f"{section}_{key}")
         if hasattr(self, field_name):
             setattr(self, field_name, value)
     
@@ -121,9 +202,71 @@ class Config:
         loaded_config = self.load_from_file(config_file)
         
         # Update current instance with loaded values
-        for field in self.__dataclass_fields__:
-            setattr(self, field, getattr(loaded_config, field))
+        for name in self.__dataclass_fields__:
+            setattr(self, name, getattr(loaded_config, name))
     
     def save_config(self) -> bool:
         """Save current configuration"""
-        return self.save_to_file() 
\ No newline at end of file
+        return self.save_to_file() 
+
+class ConfigWatcher:
+    """Poll a config file and hand each validated change to subscribers.
+    
+    Subscribers are called as callback(new_config, changed_fields) with a fresh
+    Config object; the previous one is never mutated. Edits that fail to parse
+    or validate are reported and the last good config stays active.
+    """
+    
+    def __init__(self, config_file: str, config: Config = None, interval: float = 1.0):
+        self.config_file = config_file
+        self.interval = interval
+        self.config = config or Config.load_from_file(config_file)
+        self.callbacks: List[Callable[[Config, Set[str]], None]] = []
+        self._stamp = _file_stamp(config_file) if os.path.exists(config_file) else None
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def subscribe(self, callback: Callable[[Config, Set[str]], None]):
+        """Register a callback for future changes"""
+        self.callbacks.append(callback)
+    
+    def check(self) -> Set[str]:
+        """Reload the file if it changed and return the names of the fields that changed"""
+        try:
+            stamp = _file_stamp(self.config_file)
+        except OSError:
+            return set()
+        if stamp == self._stamp:
+            return set()
+        self._stamp = stamp
+        
+        try:
+            new_config = Config.parse_file(self.config_file)
+        except Exception as e:
+            print(f"⚠️  Keeping previous config: {e}")
+            return set()
+        
+        changed = new_config.diff(self.config)
+        if changed:
+            self.config = new_config
+            print(f"🔄 Reloaded {self.config_file}: {', '.join(sorted(changed))}")
+            for callback in self.callbacks:
+                try:
+                    callback(new_config.copy(), changed)
+                except Exception as e:
+                    print(f"Error applying config change: {e}")
+        return changed
+    
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.check()
+    
+    def start(self):
+        """Start polling in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        """Stop polling"""
+        self._stop.set()
@@ -1,8 +1,10 @@
-from huggingface_hub import HfApi
 import os
 
 def upload_to_hf(folder_path: str, repo_id: str, repo_type: str, hf_token: str):
-    hf_token = os.getenv("HF_TOKEN")
+    # huggingface_hub is slow to import and only needed when uploading
+    from huggingface_hub import HfApi
+    # Fall back to the HF_TOKEN environment variable when the config has no token
+    hf_token = hf_token or os.getenv("HF_TOKEN")
     api = HfApi(token=hf_token)
     api.upload_folder(
         folder_path=folder_path,
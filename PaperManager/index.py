@@ -0,0 +1,200 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+ARXIV_ID_PATTERN = re.compile(r'\[(\d{4}\.\d{4,5})\]')
+SORT_FIELDS = ["title", "keywords", "url", "type"]
+
+def page_count(total: int, page_size: int) -> int:
+    """Number of pages needed for `total` rows (at least one, even when empty)"""
+    return max(1, -(-total // max(1, page_size)))
+
+def extract_arxiv_id(title: str) -> str:
+    """Extract arXiv ID from title format [arXiv_ID] Title"""
+    match = ARXIV_ID_PATTERN.search(title)
+    return match.group(1) if match else ""
+
+class PaperIndex:
+    """In-memory lookup structures kept in sync with the paper list.
+
+    The index shares the `papers` list with its owner and is the only place that
+    should mutate it, so lookups by title, arXiv ID and type never go stale.
+    """
+
+    def __init__(self, papers: List[Dict]):
+        self.rebuild(papers)
+
+    def rebuild(self, papers: List[Dict]):
+        """Rebuild every lookup table from scratch"""
+        self.papers = papers
+        self.titles = {}
+        self.arxiv_ids = {}
+        self.by_type = {}
+        self._title_counts = {}
+        self._arxiv_counts = {}
+        self._invalidate()
+
+        # Same as calling _insert for every paper, inlined since it runs at startup
+        titles, arxiv_ids, by_type = self.titles, self.arxiv_ids, self.by_type
+        title_counts, arxiv_counts = self._title_counts, self._arxiv_counts
+        search = ARXIV_ID_PATTERN.search
+        for paper in papers:
+            title = paper['title']
+            title_lower = title.lower()
+            if title_lower in titles:
+                title_counts[title_lower] += 1
+            else:
+                titles[title_lower] = paper
+                title_counts[title_lower] = 1
+            match = search(title)
+            if match:
+                arxiv_id = match.group(1)
+                if arxiv_id in arxiv_ids:
+                    arxiv_counts[arxiv_id] += 1
+                else:
+                    arxiv_ids[arxiv_id] = paper
+                    arxiv_counts[arxiv_id] = 1
+            paper_type = paper['type'].lower()
+            if paper_type in by_type:
+                by_type[paper_type].append(paper)
+            else:
+                by_type[paper_type] = [paper]
+
+    def _invalidate(self):
+        # Sorted views and the last filter result depend on the whole list
+        self._views = {}
+        self._last_filter = None
+
+    def _insert(self, paper: Dict):
+        title = paper['title'].lower()
+        self.titles.setdefault(title, paper)
+        self._title_counts[title] = self._title_counts.get(title, 0) + 1
+        arxiv_id = extract_arxiv_id(paper['title'])
+        if arxiv_id:
+            self.arxiv_ids.setdefault(arxiv_id, paper)
+            self._arxiv_counts[arxiv_id] = self._arxiv_counts.get(arxiv_id, 0) + 1
+        self.by_type.setdefault(paper['type'].lower(), []).append(paper)
+
+    def _forget(self, lookup: Dict[str, Dict], counts: Dict[str, int], key: str, paper: Dict, key_of):
+        counts[key] -= 1
+        if not counts[key]:
+            del counts[key]
+        if lookup.get(key) is not paper:
+            return
+        del lookup[key]
+        if key in counts:
+            # Hand-edited CSVs can hold duplicates; promote the next one still in the list
+            replacement = next((p for p in self.papers if p is not paper and key_of(p) == key), None)
+            if replacement is not None:
+                lookup[key] = replacement
+
+    def _discard(self, paper: Dict):
+        self._forget(self.titles, self._title_counts, paper['title'].lower(), paper, lambda p: p['title'].lower())
+        arxiv_id = extract_arxiv_id(paper['title'])
+        if arxiv_id:
+            self._forget(self.arxiv_ids, self._arxiv_counts, arxiv_id, paper, lambda p: extract_arxiv_id(p['title']))
+        same_type = self.by_type.get(paper['type'].lower(), [])
+        for i, other in enumerate(same_type):
+            if other is paper:
+                del same_type[i]
+                break
+
+    def find_duplicate(self, title: str, ignore: Dict = None) -> Optional[Dict]:
+        """Return an existing paper (other than `ignore`) with the same title or arXiv ID, if any"""
+        existing = self.titles.get(title.lower())
+        if existing is not None and existing is not ignore:
+            return existing
+        arxiv_id = extract_arxiv_id(title)
+        existing = self.arxiv_ids.get(arxiv_id) if arxiv_id else None
+        return existing if existing is not ignore else None
+
+    def add(self, paper: Dict):
+        """Append a paper to the list and index it"""
+        self.papers.append(paper)
+        self._insert(paper)
+        self._invalidate()
+
+    def remove_title(self, title: str) -> List[Dict]:
+        """Remove every paper with this title (case-insensitive) and return them"""
+        title_lower = title.lower()
+        removed = [p for p in self.papers if p['title'].lower() == title_lower]
+        if removed:
+            # Filter first so _discard cannot promote a paper that is also being removed
+            self.papers[:] = [p for p in self.papers if p['title'].lower() != title_lower]
+            for paper in removed:
+                self._discard(paper)
+            self._invalidate()
+        return removed
+
+    def update(self, paper: Dict, changes: Dict[str, str]):
+        """Apply field changes to a paper in place and re-index it"""
+        self._discard(paper)
+        paper.update(changes)
+        self._insert(paper)
+        # _insert appended the paper to its type list; restore paper list order
+        paper_type = paper['type'].lower()
+        self.by_type[paper_type] = [p for p in self.papers if p['type'].lower() == paper_type]
+        self._invalidate()
+
+    @staticmethod
+    def _matching(papers: List[Dict], query_lower: str) -> List[Dict]:
+        return [
+            p for p in papers
+            if query_lower in p['title'].lower() or query_lower in p['keywords'].lower()
+        ]
+
+    def search(self, query: str) -> List[Dict]:
+        """Return papers whose title or keywords contain the query (case-insensitive)"""
+        return self._matching(self.papers, query.lower())
+
+    def _view(self, paper_type: str, sort_by: str) -> List[Dict]:
+        # Full (unfiltered by keyword) view for a type and sort key, cached until the next mutation
+        key = (paper_type, sort_by)
+        view = self._views.get(key)
+        if view is None:
+            view = self.by_type.get(paper_type, []) if paper_type else self.papers
+            if sort_by:
+                view = sorted(view, key=lambda p: p[sort_by].lower())
+            self._views[key] = view
+        return view
+
+    def page(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        paper_type: str = "",
+        keyword: str = "",
+        sort_by: str = "",
+        descending: bool = False
+    ) -> Tuple[List[Dict], int, int]:
+        """Return one page of papers, the total number of matches and the clamped page number.
+
+        Args:
+            page (int): 1-based page number, clamped to the available range
+            page_size (int): Number of rows per page
+            paper_type (str): Only include papers of this type (empty for all)
+            keyword (str): Only include papers whose title or keywords contain it
+            sort_by (str): Field to sort by (empty keeps insertion order)
+            descending (bool): Reverse the order
+        """
+        if sort_by and sort_by not in SORT_FIELDS:
+            raise ValueError(f"Cannot sort by '{sort_by}', expected one of {SORT_FIELDS}")
+        paper_type = paper_type.lower()
+        keyword = keyword.strip().lower()
+
+        rows = self._view(paper_type, sort_by)
+        if keyword:
+            key = (paper_type, sort_by, keyword)
+            if self._last_filter and self._last_filter[0] == key:
+                rows = self._last_filter[1]
+            else:
+                rows = self._matching(rows, keyword)
+                self._last_filter = (key, rows)
+
+        total = len(rows)
+        page_size = max(1, page_size)
+        page = min(max(1, page), page_count(total, page_size))
+        start = (page - 1) * page_size
+        if descending:
+            end = total - start
+            return rows[max(0, end - page_size):end][::-1], total, page
+        return rows[start:start + page_size], total, page
@@ -0,0 +1,148 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+from .agent import PaperManager, normalize_paper
+
+OPERATIONS = ["add", "search", "delete", "split", "upload"]
+
+class PaperService:
+    """Headless front-end that keeps one PaperManager (store and index) warm in memory.
+
+    Every operation is a JSON-style dict with an "op" key; the same requests are
+    accepted by the HTTP server and by `main.py batch`.
+    """
+
+    def __init__(self, paper_manager: PaperManager):
+        self.paper_manager = paper_manager
+        # ThreadingHTTPServer serves requests concurrently; holding the manager's lock for a
+        # whole batch also keeps config reloads from landing in the middle of one
+        self.lock = paper_manager.lock
+
+    def handle(self, request: Dict) -> Dict:
+        """Run a single operation"""
+        return self.batch([request])[0]
+
+    def batch(self, requests: List[Dict]) -> List[Dict]:
+        """Run operations in order, returning one result per request.
+
+        Consecutive "add" operations are written to the CSV with a single append.
+        """
+        results = []
+        with self.lock:
+            pending_adds = []
+            for request in requests:
+                if isinstance(request, dict) and request.get("op") == "add":
+                    pending_adds.append(request)
+                    continue
+                results.extend(self._add(pending_adds))
+                pending_adds = []
+                results.append(self._run(request))
+            results.extend(self._add(pending_adds))
+        return results
+
+    def _add(self, requests: List[Dict]) -> List[Dict]:
+        results = [None] * len(requests)
+        valid, papers = [], []
+        for i, request in enumerate(requests):
+            # Reject bad fields here so one request cannot fail the rest of the batch
+            try:
+                paper = normalize_paper(request)
+            except ValueError as e:
+                results[i] = {"ok": False, "op": "add", "error": str(e)}
+                continue
+            if not (paper["title"] and paper["url"]):
+                results[i] = {"ok": False, "op": "add", "error": "Both title and url are required"}
+                continue
+            valid.append(i)
+            papers.append(paper)
+        
+        try:
+            added = self.paper_manager.add_papers(papers)
+        except Exception as e:
+            added, error = [False] * len(valid), str(e)
+        else:
+            error = "Paper already exists"
+        
+        for i, paper, ok in zip(valid, papers, added):
+            results[i] = {"ok": ok, "op": "add", "title": paper["title"]}
+            if not ok:
+                results[i]["error"] = error
+        return results
+
+    def _run(self, request: Dict) -> Dict:
+        if not isinstance(request, dict):
+            return {"ok": False, "error": "Each request must be a JSON object"}
+        op = request.get("op")
+        try:
+            if op == "search":
+                return {"ok": True, "op": op, "results": self.paper_manager.search_paper(request.get("query", ""))}
+            if op == "delete":
+                if self.paper_manager.delete_paper(request.get("title", "")):
+                    return {"ok": True, "op": op}
+                return {"ok": False, "op": op, "error": "Paper not found"}
+            if op == "split":
+                return {"ok": self.paper_manager.split_into_types(), "op": op}
+            if op == "upload":
+                self.paper_manager.upload_to_hf()
+                return {"ok": True, "op": op}
+        except Exception as e:
+            return {"ok": False, "op": op, "error": str(e)}
+        return {"ok": False, "op": op, "error": f"Unknown op, expected one of {OPERATIONS}"}
+
+class PaperRequestHandler(BaseHTTPRequestHandler):
+    """JSON API: POST /<op> with the operation's fields, or POST /batch with {"requests": [...]}"""
+    service: PaperService = None
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"ok": True, "papers": len(self.service.paper_manager.papers)})
+        else:
+            self._send_json(404, {"ok": False, "error": f"Unknown path {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            # rfile.read(-1) would block until the client closes the connection
+            self._send_json(400, {"ok": False, "error": "Invalid Content-Length"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError as e:
+            self._send_json(400, {"ok": False, "error": f"Invalid JSON: {e}"})
+            return
+
+        op = self.path.strip("/")
+        if op == "batch":
+            requests = payload.get("requests") if isinstance(payload, dict) else None
+            if not isinstance(requests, list):
+                self._send_json(400, {"ok": False, "error": 'Expected {"requests": [...]}'})
+                return
+            self._send_json(200, {"ok": True, "results": self.service.batch(requests)})
+        elif op in OPERATIONS and isinstance(payload, dict):
+            result = self.service.handle({**payload, "op": op})
+            self._send_json(200, result)
+        else:
+            self._send_json(404, {"ok": False, "error": f"Unknown path {self.path}"})
+
+def serve(service: PaperService, host: str = "127.0.0.1", port: int = 8765):
+    """Serve the JSON API until interrupted"""
+    handler = type("Handler", (PaperRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    print(f"🚀 Paper Manager API listening on http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
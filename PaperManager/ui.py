@@ -1,11 +1,47 @@
+from typing import Set
 import gradio as gr
-from .agent import PaperManager
-from .config import Config
+from .agent import PaperManager, ROW_TYPE
+from .config import Config, ConfigWatcher
+from .index import SORT_FIELDS, page_count
+
+ALL_TYPES = "all"
+PAGE_SIZES = [25, 50, 100, 200]
+CONFIG_REFRESH_SECONDS = 5
+# Fields baked into the Blocks layout; changing them still needs a restart
+RESTART_FIELDS = {"ui_theme", "chatbot_height", "debug"}
+
+def table_value(rows):
+    """Library table value; explicit headers keep the columns when there are no rows"""
+    return {"headers": ROW_TYPE, "data": rows}
 
 class PaperManagerUI:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, watcher: ConfigWatcher = None):
+        self.config = config
+        self.watcher = watcher
+        # The store loads in the background while the interface is built
+        self.paper_manager = PaperManager(config=self.config, background_load=True)
+        if watcher:
+            watcher.subscribe(self.apply_config)
+    
+    def apply_config(self, config: Config, changed: Set[str]):
+        """Hot-apply a reloaded config to the UI and the paper manager"""
         self.config = config
-        self.paper_manager = PaperManager(config=self.config)
+        self.paper_manager.apply_config(config, changed)
+        if changed & RESTART_FIELDS:
+            print(f"⚠️  {', '.join(sorted(changed & RESTART_FIELDS))} will take effect after a restart")
+    
+    def render_config_info(self) -> str:
+        """Markdown summary of the active configuration"""
+        return f"""
+            **Current Configuration:**
+            - Model: `{self.config.api_model}`
+            - CSV File: `{self.config.csv_file}`
+            - Paper Types: `{', '.join(self.config.paper_types)}`
+            """
+    
+    def refresh_config_view(self):
+        """Re-render the parts of the page that depend on the config"""
+        return self.render_config_info(), gr.update(choices=[ALL_TYPES] + list(self.config.paper_types))
     
     def clear_chat_history(self):
         """Clear chat history"""
@@ -47,6 +83,66 @@ class PaperManagerUI:
         except Exception as e:
             return f"❌ Upload failed: {str(e)}"
 
+    def load_library_page(self, paper_type: str, keyword: str, sort_by: str, descending: bool, page, page_size):
+        """Fetch a single page of the library from the index"""
+        page_size = int(page_size)
+        papers, total, page = self.paper_manager.list_papers(
+            page=int(page or 1),
+            page_size=page_size,
+            paper_type="" if paper_type == ALL_TYPES else paper_type,
+            keyword=keyword or "",
+            sort_by=sort_by or "",
+            descending=bool(descending)
+        )
+        rows = [[paper[field] for field in ROW_TYPE] for paper in papers]
+        info = f"Page {page} of {page_count(total, page_size)} · {total} paper(s)"
+        # The served rows are kept in state so edits can be diffed into deltas
+        return table_value(rows), page, info, [list(row) for row in rows]
+
+    def change_library_page(self, step: int, paper_type: str, keyword: str, sort_by: str, descending: bool, page, page_size):
+        """Move the library view `step` pages forward or backward"""
+        return self.load_library_page(paper_type, keyword, sort_by, descending, int(page or 1) + step, page_size)
+
+    @staticmethod
+    def _edited_rows(table, served):
+        """(index, row) for every row of the page that differs from what was served"""
+        edited = []
+        for i, row in enumerate(table[:len(served)]):
+            row = ["" if value is None else str(value) for value in row]
+            if row != served[i]:
+                edited.append((i, row))
+        return edited
+
+    def track_library_edits(self, table, served):
+        """Report unsaved edits; saving rewrites the CSV, so it waits for the Save button"""
+        edited = self._edited_rows(table, served)
+        if not edited:
+            return "No changes to save."
+        return f"✏️ {len(edited)} edited paper(s) not saved yet. Press Save before changing page."
+
+    def apply_library_edits(self, table, served):
+        """Push cells edited in the library table back to the store as per-row deltas"""
+        edited = self._edited_rows(table, served)
+        
+        # All of the page's edits are applied together with a single CSV rewrite
+        applied = self.paper_manager.update_papers(
+            [(served[i][0], dict(zip(ROW_TYPE, row))) for i, row in edited]
+        )
+        updated, failed = 0, 0
+        for (i, row), ok in zip(edited, applied):
+            if ok:
+                served[i] = row
+                updated += 1
+            else:
+                failed += 1
+
+        status = f"✅ Saved {updated} edited paper(s)." if updated else "No changes to save."
+        if failed:
+            status += f" ❌ {failed} edit(s) rejected (unknown or duplicate title)."
+            # Revert the rejected cells to what the store holds
+            return status, served, table_value(served)
+        return status, served, gr.update()
+
     def create_interface(self):
         """Create the simplified Gradio interface"""
         with gr.Blocks(title="Paper Manager", theme=self.config.ui_theme) as interface:
@@ -54,33 +150,62 @@ class PaperManagerUI:
             gr.Markdown("Manage your research papers with AI assistance")
             
             # Display current configuration info
-            gr.Markdown(f"""
-            **Current Configuration:**
-            - Model: `{self.config.api_model}`
-            - CSV File: `{self.config.csv_file}`
-            - Paper Types: `{', '.join(self.config.paper_types)}`
-            """)
-            
-            # Main Chat Interface
-            chatbot = gr.Chatbot(
-                height=self.config.chatbot_height,
-                label="Paper Manager Assistant"
-            )
+            config_info = gr.Markdown(self.render_config_info())
             
-            with gr.Row():
-                msg_input = gr.Textbox(
-                    label="Message",
-                    placeholder="Type your message here... (e.g., 'Add this paper: https://arxiv.org/abs/2210.01117')",
-                    scale=4,
-                    max_lines=3
+            with gr.Tab("Chat"):
+                # Main Chat Interface
+                chatbot = gr.Chatbot(
+                    height=self.config.chatbot_height,
+                    label="Paper Manager Assistant"
                 )
-                with gr.Column(scale=1):
-                    send_btn = gr.Button("Send", variant="primary", size="sm")
-                    clear_btn = gr.Button("Clear History", variant="secondary", size="sm")
-                    upload_btn = gr.Button("Upload to HuggingFace 🤗", variant="secondary", size="sm")
+                
+                with gr.Row():
+                    msg_input = gr.Textbox(
+                        label="Message",
+                        placeholder="Type your message here... (e.g., 'Add this paper: https://arxiv.org/abs/2210.01117')",
+                        scale=4,
+                        max_lines=3
+                    )
+                    with gr.Column(scale=1):
+                        send_btn = gr.Button("Send", variant="primary", size="sm")
+                        clear_btn = gr.Button("Clear History", variant="secondary", size="sm")
+                        upload_btn = gr.Button("Upload to HuggingFace 🤗", variant="secondary", size="sm")
+                
+                # Status message for upload
+                upload_status = gr.Textbox(label="Upload Status", interactive=False)
             
-            # Status message for upload
-            upload_status = gr.Textbox(label="Upload Status", interactive=False)
+            # Library browser: only the visible page is sent to the browser
+            with gr.Tab("Library"):
+                with gr.Row():
+                    type_filter = gr.Dropdown(
+                        choices=[ALL_TYPES] + list(self.config.paper_types),
+                        value=ALL_TYPES,
+                        label="Type"
+                    )
+                    keyword_filter = gr.Textbox(label="Keyword", placeholder="Filter by title or keywords")
+                    sort_by = gr.Dropdown(choices=[""] + SORT_FIELDS, value="", label="Sort by")
+                    descending = gr.Checkbox(label="Descending", value=False)
+                
+                library_table = gr.Dataframe(
+                    headers=ROW_TYPE,
+                    datatype=["str"] * len(ROW_TYPE),
+                    col_count=(len(ROW_TYPE), "fixed"),
+                    type="array",
+                    interactive=True,
+                    label="Papers"
+                )
+                
+                with gr.Row():
+                    prev_btn = gr.Button("◀ Prev", size="sm")
+                    page_number = gr.Number(value=1, precision=0, label="Page")
+                    page_size = gr.Dropdown(choices=PAGE_SIZES, value=PAGE_SIZES[1], label="Page size")
+                    next_btn = gr.Button("Next ▶", size="sm")
+                    refresh_btn = gr.Button("Refresh", variant="secondary", size="sm")
+                    save_btn = gr.Button("Save edits", variant="primary", size="sm")
+                
+                page_info = gr.Markdown()
+                library_status = gr.Textbox(label="Edit Status", interactive=False)
+                served_rows = gr.State([])
             
             # Event handlers
             send_btn.click(
@@ -104,10 +229,54 @@ class PaperManagerUI:
                 fn=self.upload_to_huggingface,
                 outputs=upload_status
             )
+            
+            query_inputs = [type_filter, keyword_filter, sort_by, descending, page_number, page_size]
+            page_outputs = [library_table, page_number, page_info, served_rows]
+            
+            # Any change to the query starts again from the first page
+            first_page_inputs = [type_filter, keyword_filter, sort_by, descending, gr.State(1), page_size]
+            for control in (type_filter, sort_by, descending, page_size):
+                control.change(fn=self.load_library_page, inputs=first_page_inputs, outputs=page_outputs)
+            keyword_filter.submit(fn=self.load_library_page, inputs=first_page_inputs, outputs=page_outputs)
+            
+            page_number.submit(fn=self.load_library_page, inputs=query_inputs, outputs=page_outputs)
+            refresh_btn.click(fn=self.load_library_page, inputs=query_inputs, outputs=page_outputs)
+            prev_btn.click(
+                fn=lambda *args: self.change_library_page(-1, *args),
+                inputs=query_inputs,
+                outputs=page_outputs
+            )
+            next_btn.click(
+                fn=lambda *args: self.change_library_page(1, *args),
+                inputs=query_inputs,
+                outputs=page_outputs
+            )
+            
+            # Every cell edit fires .input; only the Save button writes to the store
+            library_table.input(
+                fn=self.track_library_edits,
+                inputs=[library_table, served_rows],
+                outputs=library_status
+            )
+            save_btn.click(
+                fn=self.apply_library_edits,
+                inputs=[library_table, served_rows],
+                outputs=[library_status, served_rows, library_table]
+            )
+            
+            interface.load(fn=self.load_library_page, inputs=query_inputs, outputs=page_outputs)
+            
+            if self.watcher:
+                # Pick up hot-reloaded config values without rebuilding the page
+                interface.load(
+                    fn=self.refresh_config_view,
+                    outputs=[config_info, type_filter],
+                    every=CONFIG_REFRESH_SECONDS
+                )
         
         return interface
 
-def create_paper_manager_ui(config: Config):
+def create_paper_manager_ui(config: Config, watcher: ConfigWatcher = None):
     """Create and return the PaperManager UI"""
-    ui = PaperManagerUI(config)
+    ui = PaperManagerUI(config, watcher)
     return ui.create_interface()
@@ -0,0 +1,81 @@
+import contextlib
+import csv
+import io
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from PaperManager.agent import ROW_TYPE
+
+KEYWORDS = ["llm", "rl", "agent", "interp", "moe", "quant", "kv cache", "sae", "grok", "rlhf"]
+
+def parse_size(text: str) -> int:
+    """Parse a library size such as "1k", "100k" or "1M" into a row count"""
+    text = text.strip().lower()
+    multiplier = 1
+    if text.endswith("k"):
+        multiplier, text = 1000, text[:-1]
+    elif text.endswith("m"):
+        multiplier, text = 1000000, text[:-1]
+    return int(float(text) * multiplier)
+
+def format_size(rows: int) -> str:
+    """Inverse of parse_size, used to build metric names"""
+    if rows >= 1000000 and rows % 1000000 == 0:
+        return f"{rows // 1000000}M"
+    if rows >= 1000 and rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+def synthetic_paper(i: int, types: List[str]) -> Dict[str, str]:
+    """Build a deterministic paper row with a unique arXiv ID"""
+    arxiv_id = f"{1001 + i // 100000}.{i % 100000:05d}"
+    return {
+        "title": f"[{arxiv_id}] Synthetic Paper {i} on {KEYWORDS[i % len(KEYWORDS)]}",
+        "keywords": ", ".join([KEYWORDS[i % len(KEYWORDS)], KEYWORDS[(i * 7) % len(KEYWORDS)]]),
+        "url": f"https://arxiv.org/abs/{arxiv_id}",
+        "type": types[i % len(types)],
+    }
+
+def write_library(folder: str, rows: int, types: List[str]) -> str:
+    """Write a synthetic library to <folder>/all/papers.csv and return the CSV path"""
+    main_folder = os.path.join(folder, "all")
+    os.makedirs(main_folder, exist_ok=True)
+    csv_file = os.path.join(main_folder, "papers.csv")
+    with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=ROW_TYPE)
+        writer.writeheader()
+        for i in range(rows):
+            writer.writerow(synthetic_paper(i, types))
+    return csv_file
+
+@contextlib.contextmanager
+def quiet():
+    """Silence the progress prints of the code under test"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+def measure(fn: Callable[[], object], repeat: int, setup: Callable[[], object] = None, warmup: int = 0) -> Dict[str, float]:
+    """Run fn `repeat` times and return timing statistics in seconds.
+
+    The first `warmup` runs are not timed, so one-off costs such as lazy
+    imports or opening a pooled connection do not skew the median.
+    """
+    for _ in range(warmup):
+        if setup:
+            setup()
+        fn()
+    timings = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return {
+        "min": min(timings),
+        "median": statistics.median(timings),
+        "max": max(timings),
+        "repeat": repeat,
+    }
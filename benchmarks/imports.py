@@ -0,0 +1,56 @@
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules a headless import must never pull in; they are loaded on first use instead
+HEAVY_MODULES = ["gradio", "huggingface_hub", "requests"]
+TARGETS = ["main", "PaperManager.cli", "PaperManager.agent"]
+# Interpreter start-up makes -X importtime jitter by tens of milliseconds; eager
+# gradio or huggingface_hub imports cost seconds, so this still catches them
+NOISE_FLOOR = 0.03
+
+def import_profile(module: str) -> Tuple[float, List[str]]:
+    """Import `module` in a fresh interpreter with -X importtime.
+
+    Returns the cumulative import time in seconds and every top-level package imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative, packages = 0.0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = [part.strip() for part in line[len("import time:"):].split("|")]
+        if not cumulative_us.isdigit():
+            continue  # header row
+        packages.add(name.split(".")[0])
+        if name == module:
+            cumulative = int(cumulative_us) / 1e6
+    return cumulative, sorted(packages)
+
+def bench_imports(repeat: int = 3) -> Dict[str, Dict]:
+    """Time headless imports and record any heavy module they load"""
+    results = {}
+    for module in TARGETS:
+        timings, packages = [], []
+        for _ in range(repeat):
+            cumulative, packages = import_profile(module)
+            timings.append(cumulative)
+        results[f"import.{module}"] = {
+            "min": min(timings),
+            "median": statistics.median(timings),
+            "max": max(timings),
+            "repeat": repeat,
+            "noise_floor": NOISE_FLOOR,
+            "heavy_modules": [name for name in HEAVY_MODULES if name in packages],
+        }
+    return results
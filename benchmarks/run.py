@@ -0,0 +1,104 @@
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+from typing import Dict, List
+
+from .common import parse_size
+from .imports import bench_imports
+from .store import bench_store
+from .stream import bench_stream
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Regression thresholds. A metric fails only if it is both TOLERANCE times slower
+# than baseline and slower by more than MIN_DELTA seconds (or the metric's own
+# "noise_floor", see imports.py). File writes on a loaded machine jitter by a few
+# milliseconds, which would otherwise fail every microsecond-scale operation.
+DEFAULT_TOLERANCE = 0.25
+DEFAULT_MIN_DELTA = 0.005
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float, min_delta: float = 0.0) -> List[str]:
+    """Return a line per timed metric that is slower than baseline by more than `tolerance`.
+
+    Slowdowns smaller than `min_delta` seconds (or the metric's own "noise_floor")
+    are ignored so that timer noise on fast operations does not fail the run.
+    """
+    regressions = []
+    for name, timing in results.items():
+        old = baseline.get(name)
+        if "median" not in timing or not old or "median" not in old:
+            continue
+        ratio = timing["median"] / old["median"] if old["median"] else 1.0
+        floor = max(min_delta, timing.get("noise_floor", 0.0))
+        if ratio > 1 + tolerance and timing["median"] - old["median"] > floor:
+            regressions.append(f"{name}: {old['median']:.6f}s -> {timing['median']:.6f}s ({ratio:.2f}x)")
+    return regressions
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Paper Manager benchmarks")
+    parser.add_argument("--sizes", default="1k,100k,1M", help="Comma-separated library sizes")
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions per measurement")
+    parser.add_argument("--stream-chunks", type=int, default=2000, help="SSE events per streamed response")
+    parser.add_argument("--output", default=None, help="Write JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the baseline with these results")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--skip-imports", action="store_true", help="Skip the -X importtime benchmark")
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA, help="Ignore slowdowns smaller than this many seconds")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if not args.skip_imports:
+        print("⏱️  Benchmarking import time", file=sys.stderr)
+        results.update(bench_imports(args.repeat))
+    for size in args.sizes.split(","):
+        rows = parse_size(size)
+        print(f"⏱️  Benchmarking store with {rows} rows", file=sys.stderr)
+        results.update(bench_store(rows, args.repeat))
+    print(f"⏱️  Benchmarking streaming with {args.stream_chunks} chunks", file=sys.stderr)
+    results.update(bench_stream(args.stream_chunks, args.repeat))
+
+    report = {
+        "meta": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    else:
+        print(json.dumps(report, indent=2))
+
+    # Heavy imports on the headless path fail the run regardless of timings
+    heavy = {name: r["heavy_modules"] for name, r in results.items() if r.get("heavy_modules")}
+    for name, modules in heavy.items():
+        print(f"❌ {name} imports {', '.join(modules)} eagerly", file=sys.stderr)
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Saved baseline to {args.baseline}", file=sys.stderr)
+        return 1 if heavy else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"⚠️  No baseline at {args.baseline}, skipping comparison", file=sys.stderr)
+        return 1 if heavy else 0
+
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance, args.min_delta)
+    for line in regressions:
+        print(f"❌ Regression {line}", file=sys.stderr)
+    if not regressions:
+        print("✅ No regressions against baseline", file=sys.stderr)
+    return 1 if regressions or heavy else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
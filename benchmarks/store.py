@@ -0,0 +1,73 @@
+import itertools
+import os
+import tempfile
+from typing import Dict
+
+from PaperManager.agent import PaperManager, split_into_types
+from PaperManager.config import Config
+from .common import format_size, measure, quiet, synthetic_paper, write_library
+
+def bench_store(rows: int, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Time the PaperManager store operations on a synthetic library of `rows` papers"""
+    results = {}
+    prefix = f"store.{format_size(rows)}"
+
+    with tempfile.TemporaryDirectory() as folder:
+        config = Config(hf_folder=folder)
+        csv_file = write_library(folder, rows, config.paper_types)
+        config.csv_file = csv_file
+
+        managers = []
+        def load():
+            with quiet():
+                managers.append(PaperManager(config=config))
+        results[f"{prefix}.startup_load"] = measure(load, repeat)
+        manager = managers[-1]
+        del managers[:-1]
+
+        # A new title that reuses the last arXiv ID is caught by the arXiv ID lookup
+        last = synthetic_paper(rows - 1, config.paper_types)
+        duplicate_title = last["title"].split("]")[0] + "] Duplicate Of Last Paper"
+        def add_duplicate():
+            with quiet():
+                assert not manager.add_paper(duplicate_title, last["url"])
+        results[f"{prefix}.add_paper_duplicate"] = measure(add_duplicate, repeat)
+
+        counter = itertools.count()
+        added = []
+        def add_new():
+            title = f"[9999.{next(counter):05d}] Fresh Benchmark Paper"
+            added.append(title)
+            with quiet():
+                assert manager.add_paper(title, "https://arxiv.org/abs/9999.00000", "bench", config.paper_types[0])
+        results[f"{prefix}.add_paper_new"] = measure(add_new, repeat)
+
+        def delete():
+            with quiet():
+                assert manager.delete_paper(added.pop())
+        results[f"{prefix}.delete_paper"] = measure(delete, repeat)
+
+        def search():
+            manager.search_paper("kv cache")
+        results[f"{prefix}.search_paper"] = measure(search, repeat)
+
+        def split():
+            with quiet():
+                assert split_into_types(folder, config.paper_types)
+        results[f"{prefix}.split_into_types"] = measure(split, repeat)
+
+        # The long-lived service splits from the warm index instead of re-reading the CSV
+        def split_warm():
+            with quiet():
+                assert manager.split_into_types()
+        results[f"{prefix}.split_into_types_warm"] = measure(split_warm, repeat)
+
+        batch = [synthetic_paper(rows + i, config.paper_types) for i in range(100 * repeat)]
+        def add_batch():
+            with quiet():
+                assert all(manager.add_papers([batch.pop() for _ in range(100)]))
+        results[f"{prefix}.add_papers_batch_100"] = measure(add_batch, repeat)
+
+        results[f"{prefix}.csv_bytes"] = {"value": os.path.getsize(csv_file)}
+
+    return results
@@ -0,0 +1,58 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict
+
+from PaperManager.api import call_openrouter_stream
+from .common import measure
+
+class FakeSSEHandler(BaseHTTPRequestHandler):
+    """Answer every POST with a canned OpenRouter-style SSE stream"""
+    chunks = 2000
+    token = "token "
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        event = "data: " + json.dumps({"choices": [{"delta": {"content": self.token}}]}) + "\n\n"
+        self.wfile.write((event * self.chunks + "data: [DONE]\n\n").encode("utf-8"))
+
+    def log_message(self, format, *args):
+        pass
+
+class FakeSSEServer:
+    """Run FakeSSEHandler on an ephemeral local port in a background thread"""
+    def __init__(self, chunks: int):
+        handler = type("Handler", (FakeSSEHandler,), {"chunks": chunks})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address
+        return f"http://{host}:{port}/api/v1/chat/completions"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+def bench_stream(chunks: int = 2000, repeat: int = 3) -> Dict[str, Dict[str, float]]:
+    """Time call_openrouter_stream consuming `chunks` SSE events from a local fake server"""
+    with FakeSSEServer(chunks) as server:
+        received = []
+        def consume():
+            received.clear()
+            for piece in call_openrouter_stream("bench", "fake-key", "fake/model", url=server.url):
+                received.append(piece)
+        # The first call imports requests and opens the pooled session (see api.get_session)
+        timing = measure(consume, repeat, warmup=1)
+
+    assert len(received) == chunks, f"expected {chunks} chunks, got {len(received)}: {received[-1:]}"
+    timing["chunks_per_second"] = chunks / timing["median"]
+    return {f"stream.{chunks}_chunks": timing}
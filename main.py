@@ -1,17 +1,35 @@
 import argparse
-from PaperManager.ui import create_paper_manager_ui
-from PaperManager.config import Config
+import os
+import sys
+from PaperManager.cli import add_subcommands, run_command
+from PaperManager.config import Config, ConfigWatcher
 
 def main():
-    """Main function to launch the Paper Manager UI"""
+    """Main function to launch the Paper Manager UI or run a headless command"""
     parser = argparse.ArgumentParser(description="Paper Manager UI")
     parser.add_argument("--config", default="config/base.toml", help="Configuration file to load")
+    parser.add_argument("--watch", action="store_true", help="Hot-reload the config file when it changes (UI and serve)")
+    add_subcommands(parser)
     args = parser.parse_args()
     
-    print(f"🚀 Starting Paper Manager UI with config: {args.config}")
+    # Initialize configuration with the specified config file; an invalid file is
+    # an error rather than a silent fall-back to defaults
+    if os.path.exists(args.config):
+        try:
+            config = Config.parse_file(args.config)
+        except Exception as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+    else:
+        print(f"⚠️  Config file {args.config} not found, using defaults.", file=sys.stderr)
+        config = Config()
+    watcher = ConfigWatcher(args.config, config.copy()) if args.watch else None
+    
+    # Headless commands never import gradio
+    if args.command:
+        return run_command(args, config, watcher)
     
-    # Initialize configuration with the specified config file
-    config = Config.load_from_file(args.config)
+    print(f"🚀 Starting Paper Manager UI with config: {args.config}")
     
     # Validate critical settings
     if not config.api_key:
@@ -21,8 +39,13 @@ def main():
     print(f"📁 CSV File: {config.csv_file}")
     print(f"🔑 API Key: {'✅ Set' if config.api_key else '❌ Missing'}")
     
+    # gradio is by far the slowest import, so only load it when the UI is launched
+    from PaperManager.ui import create_paper_manager_ui
+    
     # Create the interface with the config
-    interface = create_paper_manager_ui(config)
+    interface = create_paper_manager_ui(config, watcher)
+    if watcher:
+        watcher.start()
     
     # Enable queue for streaming support
     interface.queue()
@@ -35,6 +58,7 @@ def main():
         # Fallback to basic launch
         interface.queue()  # Make sure queue is enabled in fallback too
         interface.launch()
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
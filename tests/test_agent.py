@@ -0,0 +1,112 @@
+import csv
+import os
+import tempfile
+import threading
+import unittest
+from PaperManager.agent import PaperManager
+from PaperManager.config import Config
+
+class AddPapersTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.folder.name, "papers.csv")
+        self.manager = PaperManager(config=Config(csv_file=self.csv_file))
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def rows(self):
+        with open(self.csv_file, 'r', encoding='utf-8') as f:
+            return [row['title'] for row in csv.DictReader(f)]
+
+    def test_invalid_field_adds_nothing(self):
+        with self.assertRaises(ValueError):
+            self.manager.add_papers([
+                {"title": "[2101.00001] Good", "url": "u"},
+                {"title": 123, "url": "u"},
+            ])
+        self.assertEqual(self.manager.papers, [])
+        self.assertEqual(self.rows(), [])
+        self.assertEqual(self.manager.add_papers([{"title": "[2101.00001] Good", "url": "u"}]), [True])
+
+    def test_none_becomes_empty_string(self):
+        self.assertEqual(self.manager.add_papers([{"title": "X", "url": "u", "type": None}]), [True])
+        self.assertEqual(self.manager.papers[0]["type"], "")
+        self.assertTrue(self.manager.delete_paper("X"))
+
+    def test_duplicates_within_batch(self):
+        added = self.manager.add_papers([
+            {"title": "[2101.00001] A", "url": "u"},
+            {"title": "[2101.00001] B", "url": "u"},
+            {"title": "[2101.00002] C", "url": "u"},
+        ])
+        self.assertEqual(added, [True, False, True])
+        self.assertEqual(self.rows(), ["[2101.00001] A", "[2101.00002] C"])
+
+class LoadStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.folder.name, "papers.csv")
+        with open(self.csv_file, 'w', encoding='utf-8') as f:
+            f.write("title,keywords,url,type\nOnly Title\n[2101.00001] Full,kv,u,interp\n")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_short_row_loads_as_empty_fields(self):
+        manager = PaperManager(config=Config(csv_file=self.csv_file))
+        self.assertEqual(manager.papers[0], {"title": "Only Title", "keywords": "", "url": "", "type": ""})
+        self.assertEqual([p["title"] for p in manager.search_paper("title")], ["Only Title"])
+        self.assertTrue(manager.add_paper("[2101.00002] New", "u"))
+        self.assertTrue(manager.delete_paper("Only Title"))
+
+    def test_short_row_in_background_load(self):
+        manager = PaperManager(config=Config(csv_file=self.csv_file), background_load=True)
+        self.assertEqual(len(manager.list_papers(paper_type="interp")[0]), 1)
+
+class ApplyConfigTest(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.csv_file = os.path.join(self.folder.name, "papers.csv")
+        self.manager = PaperManager(config=Config(csv_file=self.csv_file))
+        self.manager.add_paper("[2101.00001] A", "u")
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def test_swaps_in_new_store(self):
+        other = os.path.join(self.folder.name, "other.csv")
+        config = self.manager.config.copy()
+        config.csv_file = other
+        self.manager.apply_config(config)
+        self.assertEqual(self.manager.csv_file, other)
+        self.assertEqual(self.manager.papers, [])
+        self.assertTrue(os.path.exists(other))
+
+    def test_swap_waits_for_writes_in_progress(self):
+        other = os.path.join(self.folder.name, "other.csv")
+        config = self.manager.config.copy()
+        config.csv_file = other
+        with self.manager.lock:
+            reload = threading.Thread(target=self.manager.apply_config, args=(config,))
+            reload.start()
+            reload.join(0.2)
+            # The new store is loaded but not swapped in while a write holds the lock
+            self.assertTrue(reload.is_alive())
+            self.assertEqual(self.manager.csv_file, self.csv_file)
+            self.assertEqual(len(self.manager.papers), 1)
+        reload.join()
+        self.assertEqual(self.manager.csv_file, other)
+        self.assertEqual(self.manager.papers, [])
+
+    def test_bad_csv_file_keeps_old_store(self):
+        config = self.manager.config.copy()
+        config.csv_file = os.path.join(self.folder.name, "missing", "papers.csv")
+        self.manager.apply_config(config)
+        self.assertEqual(self.manager.csv_file, self.csv_file)
+        self.assertEqual(self.manager.config.csv_file, self.csv_file)
+        self.assertEqual([p["title"] for p in self.manager.papers], ["[2101.00001] A"])
+        self.assertTrue(self.manager.add_paper("[2101.00002] B", "u"))
+
+if __name__ == "__main__":
+    unittest.main()
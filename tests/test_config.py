@@ -0,0 +1,87 @@
+import os
+import tempfile
+import unittest
+from PaperManager.config import Config, ConfigWatcher
+
+class ValidateTest(unittest.TestCase):
+    def test_defaults_are_valid(self):
+        self.assertEqual(Config().validate(), [])
+
+    def test_rejects_out_of_range_values(self):
+        errors = Config(api_temperature=3, chatbot_height=0, paper_types=[]).validate()
+        self.assertEqual([e.split()[0] for e in errors], ["api_temperature", "paper_types", "chatbot_height"])
+
+    def test_bool_and_int_are_not_interchangeable(self):
+        self.assertEqual(Config(api_temperature=1).validate(), [])
+        errors = Config(api_max_tokens=True, debug=1).validate()
+        self.assertEqual([e.split()[0] for e in errors], ["api_max_tokens", "debug"])
+
+    def test_secrets_are_not_echoed(self):
+        errors = Config(api_key=12345, hf_token=67890, api_model=42).validate()
+        self.assertEqual(errors[1], "api_key must be a string, got int")
+        self.assertNotIn("67890", errors[2])
+        self.assertIn("got 42", errors[0])
+
+class ConfigFileTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.folder.name, "config.toml")
+        self.write('[api]\nmodel = "a/model"\n')
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+    def write(self, text: str):
+        with open(self.config_file, 'w', encoding='utf-8') as f:
+            f.write(text)
+
+class ParseFileTest(ConfigFileTestCase):
+    def test_cache_hit_returns_independent_copy(self):
+        first = Config.parse_file(self.config_file)
+        first.paper_types.append("mutated")
+        first.api_model = "changed"
+        second = Config.parse_file(self.config_file)
+        self.assertIsNot(first, second)
+        self.assertEqual(second.api_model, "a/model")
+        self.assertNotIn("mutated", second.paper_types)
+
+    def test_changed_file_is_reparsed(self):
+        Config.parse_file(self.config_file)
+        self.write('[api]\nmodel = "another/model"\n')
+        self.assertEqual(Config.parse_file(self.config_file).api_model, "another/model")
+
+    def test_invalid_file_raises(self):
+        self.write('[api]\ntemperature = 5\n')
+        with self.assertRaises(ValueError):
+            Config.parse_file(self.config_file)
+
+class ConfigWatcherTest(ConfigFileTestCase):
+    def setUp(self):
+        super().setUp()
+        self.watcher = ConfigWatcher(self.config_file, Config.parse_file(self.config_file))
+        self.received = []
+        self.watcher.subscribe(lambda config, changed: self.received.append((config, changed)))
+
+    def test_unchanged_file_is_not_reloaded(self):
+        self.assertEqual(self.watcher.check(), set())
+        self.assertEqual(self.received, [])
+
+    def test_subscribers_get_only_changed_fields(self):
+        self.write('[api]\nmodel = "a/model"\ntemperature = 1.5\n')
+        self.assertEqual(self.watcher.check(), {"api_temperature"})
+        config, changed = self.received[0]
+        self.assertEqual(changed, {"api_temperature"})
+        self.assertEqual(config.api_temperature, 1.5)
+        self.assertIsNot(config, self.watcher.config)
+
+    def test_invalid_edit_keeps_last_good_config(self):
+        self.write('[api]\nmodel = "a/model"\nmax_tokens = -1\n')
+        self.assertEqual(self.watcher.check(), set())
+        self.assertEqual(self.received, [])
+        self.assertEqual(self.watcher.config.api_max_tokens, Config().api_max_tokens)
+        # A later valid edit is still picked up
+        self.write('[api]\nmodel = "other/model"\n')
+        self.assertEqual(self.watcher.check(), {"api_model"})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from PaperManager.index import PaperIndex
+
+def paper(title: str, paper_type: str = "efficiency", keywords: str = "") -> dict:
+    return {"title": title, "keywords": keywords, "url": "u", "type": paper_type}
+
+class RemoveTitleTest(unittest.TestCase):
+    def test_duplicate_titles_do_not_leave_stale_arxiv_lookup(self):
+        a, b, c = paper("[2101.00001] X"), paper("[2101.00001] X"), paper("[2101.00001] Y")
+        index = PaperIndex([a, b, c])
+
+        self.assertEqual(index.remove_title("[2101.00001] x"), [a, b])
+        self.assertEqual(index.papers, [c])
+        self.assertIs(index.arxiv_ids["2101.00001"], c)
+        self.assertIsNone(index.titles.get("[2101.00001] x"))
+
+        index.remove_title("[2101.00001] Y")
+        self.assertEqual(index.papers, [])
+        self.assertIsNone(index.find_duplicate("[2101.00001] New"))
+        self.assertEqual(index.by_type["efficiency"], [])
+
+    def test_promotes_remaining_duplicate(self):
+        a, b = paper("[2101.00001] X"), paper("[2101.00001] Other")
+        index = PaperIndex([a, b])
+        index.remove_title("[2101.00001] X")
+        self.assertIs(index.find_duplicate("[2101.00001] Again"), b)
+
+class UpdateTest(unittest.TestCase):
+    def test_rename_moves_lookups(self):
+        a, b = paper("[2101.00001] A"), paper("[2101.00002] B")
+        index = PaperIndex([a, b])
+        index.update(a, {"title": "[2101.00003] A2"})
+        self.assertIsNone(index.find_duplicate("[2101.00001] A"))
+        self.assertIs(index.find_duplicate("[2101.00003] anything"), a)
+        self.assertIs(index.titles["[2101.00003] a2"], a)
+
+    def test_keeps_type_view_in_list_order(self):
+        a, b, c = paper("A"), paper("B"), paper("C", "interp")
+        index = PaperIndex([a, b, c])
+        index.update(a, {"keywords": "edited"})
+        self.assertEqual(index.by_type["efficiency"], [a, b])
+        index.update(c, {"type": "efficiency"})
+        self.assertEqual(index.by_type["efficiency"], [a, b, c])
+        self.assertEqual(index.by_type["interp"], [])
+
+    def test_invalidates_cached_views(self):
+        a, b = paper("A"), paper("B")
+        index = PaperIndex([a, b])
+        self.assertEqual(index.page(sort_by="title")[0], [a, b])
+        index.update(a, {"title": "Z"})
+        self.assertEqual(index.page(sort_by="title")[0], [b, a])
+
+class PageTest(unittest.TestCase):
+    def setUp(self):
+        self.papers = [paper(f"P{i:02d}", "efficiency" if i % 2 else "interp", "kv" if i % 3 == 0 else "") for i in range(10)]
+        self.index = PaperIndex(self.papers)
+
+    def test_pages_and_clamps(self):
+        rows, total, page = self.index.page(page=2, page_size=4)
+        self.assertEqual((rows, total, page), (self.papers[4:8], 10, 2))
+        rows, total, page = self.index.page(page=99, page_size=4)
+        self.assertEqual((rows, page), (self.papers[8:], 3))
+        self.assertEqual(self.index.page(page=0, page_size=4)[2], 1)
+
+    def test_descending(self):
+        rows, _, _ = self.index.page(page=1, page_size=3, sort_by="title", descending=True)
+        self.assertEqual([p["title"] for p in rows], ["P09", "P08", "P07"])
+        rows, _, _ = self.index.page(page=4, page_size=3, sort_by="title", descending=True)
+        self.assertEqual([p["title"] for p in rows], ["P00"])
+
+    def test_type_and_keyword_filters(self):
+        rows, total, _ = self.index.page(paper_type="Efficiency", keyword="KV")
+        self.assertEqual([p["title"] for p in rows], ["P03", "P09"])
+        self.assertEqual(total, 2)
+        # The cached filter result must not survive a mutation
+        self.index.add(paper("P10", "efficiency", "kv"))
+        self.assertEqual(self.index.page(paper_type="efficiency", keyword="kv")[1], 3)
+
+    def test_empty(self):
+        self.assertEqual(PaperIndex([]).page(page=5), ([], 0, 1))
+
+    def test_rejects_unknown_sort_field(self):
+        with self.assertRaises(ValueError):
+            self.index.page(sort_by="year")
+
+if __name__ == "__main__":
+    unittest.main()
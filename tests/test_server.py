@@ -0,0 +1,137 @@
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import ThreadingHTTPServer
+from unittest import mock
+from PaperManager.agent import PaperManager
+from PaperManager.cli import run_command
+from PaperManager.config import Config
+from PaperManager.server import PaperRequestHandler, PaperService
+
+class ServiceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.TemporaryDirectory()
+        self.config = Config(csv_file=os.path.join(self.folder.name, "papers.csv"))
+        self.manager = PaperManager(config=self.config)
+        self.service = PaperService(self.manager)
+
+    def tearDown(self):
+        self.folder.cleanup()
+
+class PaperServiceTest(ServiceTestCase):
+    def test_consecutive_adds_share_one_append(self):
+        with mock.patch.object(self.manager, "add_papers", wraps=self.manager.add_papers) as add_papers:
+            results = self.service.batch([
+                {"op": "add", "title": "[2101.00001] A", "url": "u"},
+                {"op": "add", "title": "[2101.00002] B", "url": "u"},
+                {"op": "search", "query": "[2101"},
+                {"op": "add", "title": "[2101.00003] C", "url": "u"},
+            ])
+        self.assertEqual([len(call.args[0]) for call in add_papers.call_args_list], [2, 1])
+        self.assertEqual([r["op"] for r in results], ["add", "add", "search", "add"])
+        self.assertEqual(len(results[2]["results"]), 2)
+        self.assertEqual(len(self.manager.papers), 3)
+
+    def test_per_item_errors_keep_order(self):
+        results = self.service.batch([
+            {"op": "add", "title": "[2101.00001] A", "url": "u"},
+            {"op": "add", "title": 123, "url": "u"},
+            {"op": "add", "title": "No URL"},
+            {"op": "add", "title": "[2101.00001] Again", "url": "u"},
+            "not an object",
+            {"op": "rename"},
+            {"op": "delete", "title": "Missing"},
+        ])
+        self.assertEqual([r["ok"] for r in results], [True, False, False, False, False, False, False])
+        self.assertEqual(results[0]["title"], "[2101.00001] A")
+        self.assertIn("title", results[1]["error"])
+        self.assertEqual(results[2]["error"], "Both title and url are required")
+        self.assertEqual(results[3]["error"], "Paper already exists")
+        self.assertEqual(results[4]["error"], "Each request must be a JSON object")
+        self.assertIn("Unknown op", results[5]["error"])
+        self.assertEqual(results[6]["error"], "Paper not found")
+        self.assertEqual([p["title"] for p in self.manager.papers], ["[2101.00001] A"])
+
+class QuietHandler(PaperRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+class RequestHandlerTest(ServiceTestCase):
+    def setUp(self):
+        super().setUp()
+        handler = type("Handler", (QuietHandler,), {"service": self.service})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def request(self, method: str, path: str, body: bytes = None, headers: dict = None):
+        connection = http.client.HTTPConnection(*self.server.server_address, timeout=5)
+        try:
+            connection.request(method, path, body=body, headers=headers or {})
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_add_search_and_health(self):
+        status, result = self.request("POST", "/add", json.dumps({"title": "[2101.00001] A", "url": "u"}).encode())
+        self.assertEqual((status, result["ok"]), (200, True))
+        status, result = self.request("POST", "/search", b'{"query": "2101"}')
+        self.assertEqual([p["title"] for p in result["results"]], ["[2101.00001] A"])
+        self.assertEqual(self.request("GET", "/health"), (200, {"ok": True, "papers": 1}))
+
+    def test_batch(self):
+        body = json.dumps({"requests": [
+            {"op": "add", "title": "A", "url": "u"},
+            {"op": "delete", "title": "A"},
+        ]}).encode()
+        status, result = self.request("POST", "/batch", body)
+        self.assertEqual(status, 200)
+        self.assertEqual([r["ok"] for r in result["results"]], [True, True])
+
+    def test_bad_requests(self):
+        self.assertEqual(self.request("POST", "/add", b"{not json")[0], 400)
+        self.assertEqual(self.request("POST", "/batch", b'{"requests": {}}')[0], 400)
+        self.assertEqual(self.request("POST", "/add", b"", {"Content-Length": "-1"})[0], 400)
+        self.assertEqual(self.request("POST", "/add", b"", {"Content-Length": "many"})[0], 400)
+
+    def test_unknown_paths(self):
+        self.assertEqual(self.request("GET", "/papers")[0], 404)
+        self.assertEqual(self.request("POST", "/rename", b"{}")[0], 404)
+        self.assertEqual(self.request("POST", "/add", b"[]")[0], 404)
+
+class BatchCommandTest(ServiceTestCase):
+    def run_batch(self, path: str):
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+            code = run_command(argparse.Namespace(command="batch", file=path), self.config)
+        return code, output.getvalue()
+
+    def test_malformed_line_gets_its_own_error(self):
+        path = os.path.join(self.folder.name, "requests.jsonl")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{"op": "add", "title": "A", "url": "u"}\n\n{"op": "add",\n{"op": "search", "query": "a"}\n')
+        code, output = self.run_batch(path)
+        results = [json.loads(line) for line in output.splitlines()]
+        self.assertEqual(code, 1)
+        self.assertEqual([r["ok"] for r in results], [True, False, True])
+        self.assertTrue(results[1]["error"].startswith("Invalid JSON on line 3"))
+        self.assertEqual(len(results[2]["results"]), 1)
+
+    def test_missing_file(self):
+        code, output = self.run_batch(os.path.join(self.folder.name, "missing.jsonl"))
+        self.assertEqual(code, 1)
+        self.assertIn("Cannot read requests", output)
+
+if __name__ == "__main__":
+    unittest.main()